@@ -0,0 +1,259 @@
+"""
+Route benchmarks for the Product service
+
+Seeds the products table with N fake cars from tests.factories.ProductFactory
+and measures throughput and p50/p99 latency of every route, first through the
+Flask test client and then through a real gunicorn process on localhost.
+
+Run from the repository root, for example:
+    python -m benchmarks.bench_routes --database-uri postgresql://localhost/bench \
+        --rows 1000 100000 1000000
+    python -m benchmarks.bench_routes --sqlite --rows 1000 --output results.json
+
+The products table of the chosen database is replaced, so point it at a
+scratch database. Results are written as JSON so they can be diffed between
+commits.
+"""
+
+import argparse
+import http.client
+import json
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks import common
+
+BASE_URL = "/products"
+ROUTES = ["list", "filtered_list", "get", "create", "update", "delete"]
+LIST_ROUTES = {"list", "filtered_list"}
+
+
+######################################################################
+#  T R A N S P O R T S
+######################################################################
+
+
+class TestClientTransport:
+    """Sends requests through the Flask test client (no network, no WSGI server)"""
+
+    name = "test_client"
+
+    def __init__(self, app):
+        self.client = app.test_client()
+
+    def request(self, method, path, payload=None):
+        """Sends one request and returns the status code"""
+        response = self.client.open(path, method=method, json=payload)
+        return response.status_code
+
+
+class HttpTransport:
+    """Sends requests over HTTP to a gunicorn process on localhost"""
+
+    name = "gunicorn"
+
+    def __init__(self, port):
+        self.base = f"http://127.0.0.1:{port}"
+
+    def request(self, method, path, payload=None):
+        """Sends one request and returns the status code (None if it never got one)"""
+        data = None
+        headers = {}
+        if payload is not None:
+            data = json.dumps(payload).encode("utf-8")
+            headers["Content-Type"] = "application/json"
+        req = urllib.request.Request(
+            self.base + path, data=data, headers=headers, method=method
+        )
+        try:
+            with urllib.request.urlopen(req, timeout=120) as response:
+                response.read()
+                return response.status
+        except urllib.error.HTTPError as error:
+            return error.code
+        except (http.client.HTTPException, OSError):
+            # refused, reset or dropped under load: counted as an error
+            return None
+
+
+######################################################################
+#  W O R K L O A D S
+######################################################################
+
+
+def build_workload(route, count, ids):
+    """Returns a list of (method, path, payload, expected_status) requests"""
+    # pylint: disable=import-outside-toplevel
+    from tests.factories import ProductFactory
+
+    def payload():
+        data = ProductFactory.build().serialize()
+        data.pop("id", None)
+        return data
+
+    if route == "list":
+        return [("GET", BASE_URL, None, 200)] * count
+    if route == "filtered_list":
+        path = f"{BASE_URL}?category=SUV&price=50000.00"
+        return [("GET", path, None, 200)] * count
+    if route == "create":
+        return [("POST", BASE_URL, payload(), 201) for _ in range(count)]
+    if not ids:
+        return []
+    if route == "get":
+        return [
+            ("GET", f"{BASE_URL}/{ids[i % len(ids)]}", None, 200) for i in range(count)
+        ]
+    if route == "update":
+        return [
+            ("PUT", f"{BASE_URL}/{ids[i % len(ids)]}", payload(), 200)
+            for i in range(count)
+        ]
+    if route == "delete":
+        victims = ids[-count:]
+        return [
+            ("DELETE", f"{BASE_URL}/{product_id}", None, 204) for product_id in victims
+        ]
+    raise ValueError(f"unknown route {route}")
+
+
+def run_workload(transport, workload, concurrency=1, warmup=()):
+    """Sends every request in workload and summarizes the latencies
+
+    Requests in warmup are sent first, the same way, but not recorded, so
+    worker boot, connection setup and first-hit caches do not land in p99.
+    """
+
+    def timed(item):
+        method, path, payload, expected = item
+        start = time.perf_counter()
+        status = transport.request(method, path, payload)
+        return time.perf_counter() - start, status == expected
+
+    def send(items):
+        if concurrency > 1:
+            with ThreadPoolExecutor(max_workers=concurrency) as pool:
+                return list(pool.map(timed, items))
+        return [timed(item) for item in items]
+
+    send(warmup)
+    start = time.perf_counter()
+    outcomes = send(workload)
+    elapsed = time.perf_counter() - start
+    latencies = [latency for latency, _ in outcomes]
+    errors = sum(1 for _, ok in outcomes if not ok)
+    return common.summarize(latencies, elapsed, errors)
+
+
+def benchmark_transport(transport, args, ids, concurrency=1):
+    """Runs every selected route against one transport
+
+    Routes always run in ROUTES order, whatever order they were selected in,
+    so delete comes last and never removes rows the other routes still use.
+    """
+    results = []
+    for route in [route for route in ROUTES if route in args.routes]:
+        count = args.list_requests if route in LIST_ROUTES else args.requests
+        warmup = max(args.warmup, concurrency)
+        workload = build_workload(route, warmup + count, ids)
+        if len(workload) <= warmup:
+            continue
+        result = run_workload(
+            transport, workload[warmup:], concurrency, warmup=workload[:warmup]
+        )
+        result.update(
+            {"mode": transport.name, "route": route, "concurrency": concurrency}
+        )
+        results.append(result)
+        common.progress(
+            f"  {transport.name:<11} {route:<14} "
+            f"{result['throughput_rps']:>9.1f} req/s  "
+            f"p50 {result['p50_ms']:>8.2f} ms  p99 {result['p99_ms']:>8.2f} ms  "
+            f"errors {result['errors']}"
+        )
+    return results
+
+
+######################################################################
+#  M A I N
+######################################################################
+
+
+def main(argv=None):
+    """Seeds each dataset size and benchmarks every route against it"""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    common.add_database_arguments(parser)
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 100000, 1000000])
+    parser.add_argument(
+        "--requests", type=int, default=200, help="requests per point route"
+    )
+    parser.add_argument(
+        "--list-requests", type=int, default=10, help="requests per list route"
+    )
+    parser.add_argument(
+        "--warmup", type=int, default=5, help="unrecorded requests before each route"
+    )
+    parser.add_argument("--routes", nargs="+", choices=ROUTES, default=ROUTES)
+    parser.add_argument(
+        "--modes",
+        nargs="+",
+        choices=["test_client", "gunicorn"],
+        default=["test_client", "gunicorn"],
+    )
+    parser.add_argument("--workers", type=int, default=2, help="gunicorn workers")
+    parser.add_argument(
+        "--concurrency", type=int, default=4, help="client threads against gunicorn"
+    )
+    parser.add_argument(
+        "--gunicorn-arg",
+        action="append",
+        default=[],
+        help="extra argument passed to gunicorn (repeatable)",
+    )
+    parser.add_argument("--output", help="write JSON results here instead of stdout")
+    args = parser.parse_args(argv)
+
+    database_uri = common.configure_database(args)
+    # pylint: disable=import-outside-toplevel
+    from service import app
+
+    results = []
+    for rows in args.rows:
+        common.progress(f"Seeding {rows} products...")
+        with app.app_context():
+            common.seed_products(rows)
+        for mode in args.modes:
+            with app.app_context():
+                ids = common.product_ids()
+            if mode == "test_client":
+                mode_results = benchmark_transport(TestClientTransport(app), args, ids)
+            else:
+                port = common.free_port()
+                ready_path = f"{BASE_URL}/{ids[0]}" if ids else BASE_URL
+                process = common.start_gunicorn(
+                    port, ready_path, args.workers, args.gunicorn_arg
+                )
+                try:
+                    mode_results = benchmark_transport(
+                        HttpTransport(port), args, ids, args.concurrency
+                    )
+                finally:
+                    common.stop_gunicorn(process)
+            for result in mode_results:
+                result["rows"] = rows
+            results.extend(mode_results)
+
+    common.write_results(
+        args.output,
+        "routes",
+        database_uri,
+        results,
+        workers=args.workers,
+        gunicorn_args=args.gunicorn_arg,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Startup-time benchmark for the Product service
+
+Starts a fresh interpreter several times and records how long it takes to
+import the service package and to answer the first GET /products. Cold start
+time is what autoscaling and worker recycling pay for.
+
+Run from the repository root, for example:
+    python -m benchmarks.bench_startup --sqlite --runs 20
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+from benchmarks import common
+
+# Runs in a child interpreter so every sample is a cold import
+PROBE = """
+import json, time
+start = time.perf_counter()
+from service import app
+imported = time.perf_counter()
+response = app.test_client().get("/products")
+answered = time.perf_counter()
+print(json.dumps({
+    "import_ms": (imported - start) * 1000,
+    "first_request_ms": (answered - imported) * 1000,
+    "status": response.status_code,
+}))
+"""
+
+
+def measure_once():
+    """Imports the service in a new interpreter and returns its timings"""
+    completed = subprocess.run(
+        [sys.executable, "-c", PROBE], capture_output=True, text=True, check=True
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def describe(samples):
+    """Summarizes a list of millisecond timings"""
+    return {
+        "min_ms": round(min(samples), 3),
+        "median_ms": round(statistics.median(samples), 3),
+        "max_ms": round(max(samples), 3),
+    }
+
+
+def main(argv=None):
+    """Measures import and first-request latency over several cold starts"""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    common.add_database_arguments(parser)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--output", help="write JSON results here instead of stdout")
+    args = parser.parse_args(argv)
+
+    database_uri = common.configure_database(args)
+    samples = [measure_once() for _ in range(args.runs)]
+    errors = sum(1 for sample in samples if sample["status"] != 200)
+    results = [
+        {"phase": "import", **describe([s["import_ms"] for s in samples])},
+        {
+            "phase": "first_request",
+            **describe([s["first_request_ms"] for s in samples]),
+        },
+    ]
+    for result in results:
+        common.progress(
+            f"  {result['phase']:<14} median {result['median_ms']:>8.2f} ms  "
+            f"min {result['min_ms']:>8.2f} ms  max {result['max_ms']:>8.2f} ms"
+        )
+    common.write_results(
+        args.output, "startup", database_uri, results, runs=args.runs, errors=errors
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Sync vs. gevent worker benchmark
+
+Seeds the products table once, then serves it with gunicorn using each worker
+class in turn, with the same number of worker processes, and drives it with
+many concurrent clients. Shows how much concurrency one core buys in each mode.
+
+Only meaningful against PostgreSQL: gevent workers overlap database waits
+through psycogreen, while the sqlite3 driver never yields, so --sqlite is
+refused for the gevent class.
+
+Run from the repository root, for example:
+    python -m benchmarks.bench_workers --database-uri postgresql://localhost/bench \
+        --rows 100000 --concurrency 200
+"""
+
+import argparse
+import os
+
+from benchmarks import common
+from benchmarks.bench_routes import (
+    BASE_URL,
+    HttpTransport,
+    build_workload,
+    run_workload,
+)
+
+WORKER_CLASSES = ["sync", "gevent"]
+
+
+def main(argv=None):
+    """Benchmarks the point and list routes under each gunicorn worker class"""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    common.add_database_arguments(parser)
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--requests", type=int, default=2000, help="requests per route")
+    parser.add_argument(
+        "--routes",
+        nargs="+",
+        choices=["get", "filtered_list"],
+        default=["get", "filtered_list"],
+    )
+    parser.add_argument(
+        "--worker-classes", nargs="+", choices=WORKER_CLASSES, default=WORKER_CLASSES
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="worker processes for every worker class",
+    )
+    parser.add_argument("--concurrency", type=int, default=200, help="client threads")
+    parser.add_argument(
+        "--warmup", type=int, default=5, help="unrecorded requests before each route"
+    )
+    parser.add_argument("--output", help="write JSON results here instead of stdout")
+    args = parser.parse_args(argv)
+    if args.sqlite and "gevent" in args.worker_classes:
+        parser.error(
+            "gevent cannot overlap SQLite queries; use --database-uri with "
+            "PostgreSQL or --worker-classes sync"
+        )
+
+    database_uri = common.configure_database(args)
+    # pylint: disable=import-outside-toplevel
+    from service import app
+
+    common.progress(f"Seeding {args.rows} products...")
+    with app.app_context():
+        common.seed_products(args.rows)
+        ids = common.product_ids()
+
+    results = []
+    for worker_class in args.worker_classes:
+        port = common.free_port()
+        process = common.start_gunicorn(
+            port,
+            f"{BASE_URL}/{ids[0]}",
+            args.workers,
+            [f"--worker-class={worker_class}"],
+        )
+        try:
+            transport = HttpTransport(port)
+            for route in args.routes:
+                warmup = max(args.warmup, args.concurrency)
+                workload = build_workload(route, warmup + args.requests, ids)
+                result = run_workload(
+                    transport,
+                    workload[warmup:],
+                    args.concurrency,
+                    warmup=workload[:warmup],
+                )
+                result.update(
+                    {
+                        "worker_class": worker_class,
+                        "route": route,
+                        "concurrency": args.concurrency,
+                    }
+                )
+                results.append(result)
+                common.progress(
+                    f"  {worker_class:<7} {route:<14} "
+                    f"{result['throughput_rps']:>9.1f} req/s  "
+                    f"p50 {result['p50_ms']:>8.2f} ms  p99 {result['p99_ms']:>8.2f} ms  "
+                    f"errors {result['errors']}"
+                )
+        finally:
+            common.stop_gunicorn(process)
+
+    common.write_results(
+        args.output,
+        "workers",
+        database_uri,
+        results,
+        rows=args.rows,
+        workers=args.workers,
+    )
+
+
+if __name__ == "__main__":
+    main()
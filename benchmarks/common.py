@@ -0,0 +1,195 @@
+"""
+Shared helpers for the benchmark suite
+
+Everything here avoids importing the service package at module level so the
+database URI can be chosen on the command line before the app is created.
+"""
+
+import json
+import os
+import platform
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from datetime import datetime, timezone
+
+SQLITE_DATABASE_URI = "sqlite:///benchmarks.sqlite3"
+
+
+def add_database_arguments(parser):
+    """Adds the required --database-uri / --sqlite choice to an argument parser
+
+    There is deliberately no fallback to $DATABASE_URI: seeding replaces the
+    whole products table, so the target database must be named explicitly.
+    """
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument(
+        "--database-uri",
+        help="database to benchmark against; its products table is replaced",
+    )
+    group.add_argument(
+        "--sqlite",
+        action="store_true",
+        help=f"use a local SQLite file instead ({SQLITE_DATABASE_URI})",
+    )
+
+
+def configure_database(args):
+    """Exports the chosen database URI so the service picks it up on import"""
+    uri = SQLITE_DATABASE_URI if args.sqlite else args.database_uri
+    os.environ["DATABASE_URI"] = uri
+    return uri
+
+
+def progress(message):
+    """Prints a human-readable progress line to stderr, keeping stdout pure JSON"""
+    print(message, file=sys.stderr, flush=True)
+
+
+######################################################################
+#  S E E D I N G
+######################################################################
+
+
+def seed_products(count, batch_size=5000):
+    """Replaces the products table with count fake products
+
+    Must be called inside an application context.
+    """
+    # pylint: disable=import-outside-toplevel
+    from service.models import db, Product
+    from tests.factories import bulk_create_products
+
+    db.create_all()
+    db.session.query(Product).delete()
+    db.session.commit()
+    bulk_create_products(count, batch_size)
+
+
+def product_ids():
+    """Returns the ids of every product in the table"""
+    # pylint: disable=import-outside-toplevel
+    from service.models import db, Product
+
+    return [row[0] for row in db.session.query(Product.id).order_by(Product.id)]
+
+
+######################################################################
+#  M E A S U R E M E N T
+######################################################################
+
+
+def summarize(latencies, elapsed, errors=0):
+    """Turns a list of per-request latencies (seconds) into a result dict"""
+    count = len(latencies)
+    if count > 1:
+        cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+        p50, p99 = cuts[49], cuts[98]
+    else:
+        p50 = p99 = latencies[0] if latencies else 0.0
+    return {
+        "requests": count,
+        "errors": errors,
+        "throughput_rps": round(count / elapsed, 2) if elapsed else 0.0,
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 3) if latencies else 0.0,
+        "p50_ms": round(p50 * 1000, 3),
+        "p99_ms": round(p99 * 1000, 3),
+    }
+
+
+def git_commit():
+    """Returns the current commit so results can be compared between commits"""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def write_results(path, name, database_uri, results, **meta):
+    """Writes benchmark results as JSON to path (or stdout when path is None)"""
+    document = {
+        "benchmark": name,
+        "commit": git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "database": database_uri.split("://", 1)[0],
+        **meta,
+        "results": results,
+    }
+    text = json.dumps(document, indent=2)
+    if path:
+        with open(path, "w", encoding="utf-8") as output:
+            output.write(text + "\n")
+    else:
+        print(text)
+
+
+######################################################################
+#  G U N I C O R N
+######################################################################
+
+
+def free_port():
+    """Asks the OS for an unused local TCP port"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_for_http(port, path, timeout=60.0):
+    """Blocks until a worker answers GET path on port with 200 OK
+
+    An open socket only means the gunicorn master is listening; the workers
+    may still be booting, so poll a real route instead.
+    """
+    url = f"http://127.0.0.1:{port}{path}"
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(url, timeout=5) as response:
+                if response.status == 200:
+                    return
+        except (urllib.error.URLError, OSError):
+            pass
+        time.sleep(0.05)
+    raise TimeoutError(f"{url} did not answer 200 after {timeout}s")
+
+
+def start_gunicorn(port, ready_path, workers=1, extra_args=None):
+    """Starts gunicorn serving service:app on localhost and waits until it serves"""
+    command = [
+        sys.executable,
+        "-m",
+        "gunicorn",
+        f"--bind=127.0.0.1:{port}",
+        f"--workers={workers}",
+        "--log-level=warning",
+        *(extra_args or []),
+        "service:app",
+    ]
+    # pylint: disable=consider-using-with
+    process = subprocess.Popen(command, env=os.environ.copy())
+    try:
+        wait_for_http(port, ready_path)
+    except TimeoutError:
+        process.kill()
+        raise
+    return process
+
+
+def stop_gunicorn(process):
+    """Stops a gunicorn started by start_gunicorn"""
+    process.terminate()
+    try:
+        process.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        process.kill()
@@ -0,0 +1,76 @@
+"""
+Gunicorn configuration for the Product service
+
+Gunicorn loads this file automatically from the working directory. Values
+come from the environment so the same image can be tuned without a rebuild:
+
+    GUNICORN_WORKER_CLASS=sync    one request per worker process (default)
+    GUNICORN_WORKER_CLASS=gevent  many concurrent requests per worker process
+    GUNICORN_PRELOAD=true         import the app once in the master, then fork
+
+Preloading is not supported with gevent workers: the app's connection pool
+would be built in the master, before gevent patches the worker, so its locks
+would block the whole worker once the pool runs dry. Gunicorn refuses to start
+with that combination.
+
+Command line options still take precedence over anything set here.
+"""
+import os
+
+if os.getenv("GUNICORN_BIND"):
+    bind = os.getenv("GUNICORN_BIND")
+workers = int(os.getenv("GUNICORN_WORKERS", os.getenv("WEB_CONCURRENCY", "1")))
+worker_class = os.getenv("GUNICORN_WORKER_CLASS", "sync")
+worker_connections = int(os.getenv("GUNICORN_WORKER_CONNECTIONS", "1000"))
+preload_app = os.getenv("GUNICORN_PRELOAD", "false").lower() in ("true", "1", "yes")
+
+
+def _gevent_worker_base():
+    """Returns gunicorn's GeventWorker class, or None when gevent is missing
+
+    Matching on the class rather than the --worker-class string also catches
+    gevent_pywsgi, gevent_wsgi and the full gunicorn.workers.ggevent paths.
+    """
+    try:
+        # pylint: disable=import-outside-toplevel
+        from gunicorn.workers.ggevent import GeventWorker
+    except ImportError:
+        return None
+    return GeventWorker
+
+
+def on_starting(server):
+    """Refuses to preload the app for gevent workers (see above)"""
+    gevent_worker = _gevent_worker_base()
+    if (
+        server.cfg.preload_app
+        and gevent_worker is not None
+        and issubclass(server.cfg.worker_class, gevent_worker)
+    ):
+        raise SystemExit(
+            "GUNICORN_PRELOAD / --preload cannot be combined with gevent workers"
+        )
+
+
+def post_fork(server, worker):
+    """Prepares a freshly forked worker before it loads the app
+
+    Gevent workers get psycopg2's wait callback here, ahead of the app import,
+    so even connections opened while the app is created are cooperative.
+    Connections a preloaded master handed down are dropped.
+    """
+    gevent_worker = _gevent_worker_base()
+    if gevent_worker is not None and isinstance(worker, gevent_worker):
+        # pylint: disable=import-outside-toplevel
+        from psycogreen.gevent import patch_psycopg
+
+        patch_psycopg()
+        worker.log.info("psycopg2 patched for gevent")
+    if server.cfg.preload_app:
+        # pylint: disable=import-outside-toplevel
+        from service import app
+        from service.models import db
+
+        with app.app_context():
+            for engine in db.engines.values():
+                engine.dispose(close=False)
@@ -0,0 +1,19 @@
+"""
+Pytest configuration
+
+Gives every pytest-xdist worker its own database before any test module
+imports the service, so the suite can run with `pytest -n auto`, and drops
+it again when the worker finishes.
+"""
+
+from tests.database import release_worker_database, use_worker_database
+
+
+def pytest_configure(config):  # pylint: disable=unused-argument
+    """Runs before collection, i.e. before service reads DATABASE_URI"""
+    use_worker_database()
+
+
+def pytest_unconfigure(config):  # pylint: disable=unused-argument
+    """Runs once the session is over, so the worker database is no longer used"""
+    release_worker_database()